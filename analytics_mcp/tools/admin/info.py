@@ -14,62 +14,91 @@
 
 """Tools for gathering Google Analytics account and property information."""
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict
 
 from analytics_mcp.coordinator import mcp
 from analytics_mcp.tools.utils import (
     construct_property_rn,
-    create_admin_api_client,
+    get_shared_admin_api_client,
     proto_to_dict,
 )
 from google.analytics import admin_v1beta
 
 
 @mcp.tool()
-async def get_account_summaries() -> List[Dict[str, Any]]:
-    """Retrieves information about the user's Google Analytics accounts and properties."""
+async def get_account_summaries(
+    page_size: int = 200, page_token: str = None
+) -> Dict[str, Any]:
+    """Retrieves information about the user's Google Analytics accounts and properties.
 
-    # Uses an async list comprehension so the pager returned by
-    # list_account_summaries retrieves all pages.
-    summary_pager = await create_admin_api_client().list_account_summaries()
-    all_pages = [
-        proto_to_dict(summary_page) async for summary_page in summary_pager
-    ]
-    return all_pages
+    Returns one page of account summaries. When more are available, pass the
+    returned `next_page_token` as `page_token` to retrieve the next page.
+
+    Args:
+        page_size: The maximum number of account summaries to return.
+        page_token: The `next_page_token` from a previous call.
+    """
+    request = admin_v1beta.ListAccountSummariesRequest(
+        page_size=page_size, page_token=page_token or ""
+    )
+    # The pager exposes the fields of the first response page, so only that
+    # page is fetched.
+    summary_pager = await get_shared_admin_api_client().list_account_summaries(
+        request=request
+    )
+    return {
+        "items": [
+            proto_to_dict(summary)
+            for summary in summary_pager.account_summaries
+        ],
+        "next_page_token": summary_pager.next_page_token or None,
+    }
 
 
 @mcp.tool(title="List links to Google Ads accounts")
-async def list_google_ads_links(property_id: int | str) -> List[Dict[str, Any]]:
+async def list_google_ads_links(
+    property_id: int | str, page_size: int = 200, page_token: str = None
+) -> Dict[str, Any]:
     """Returns a list of links to Google Ads accounts for a property.
 
+    Returns one page of links. When more are available, pass the returned
+    `next_page_token` as `page_token` to retrieve the next page.
+
     Args:
         property_id: The Google Analytics property ID. Accepted formats are:
           - A number
           - A string consisting of 'properties/' followed by a number
+        page_size: The maximum number of links to return.
+        page_token: The `next_page_token` from a previous call.
     """
     request = admin_v1beta.ListGoogleAdsLinksRequest(
-        parent=construct_property_rn(property_id)
+        parent=construct_property_rn(property_id),
+        page_size=page_size,
+        page_token=page_token or "",
     )
-    # Uses an async list comprehension so the pager returned by
-    # list_google_ads_links retrieves all pages.
-    links_pager = await create_admin_api_client().list_google_ads_links(
+    # The pager exposes the fields of the first response page, so only that
+    # page is fetched.
+    links_pager = await get_shared_admin_api_client().list_google_ads_links(
         request=request
     )
-    all_pages = [proto_to_dict(link_page) async for link_page in links_pager]
-    return all_pages
+    return {
+        "items": [proto_to_dict(link) for link in links_pager.google_ads_links],
+        "next_page_token": links_pager.next_page_token or None,
+    }
 
 
 @mcp.tool(title="Gets details about a property")
-def get_property_details(property_id: int | str) -> Dict[str, Any]:
+async def get_property_details(property_id: int | str) -> Dict[str, Any]:
     """Returns details about a property.
     Args:
         property_id: The Google Analytics property ID. Accepted formats are:
           - A number
           - A string consisting of 'properties/' followed by a number
     """
-    client = admin_v1beta.AnalyticsAdminServiceClient()
+    client = get_shared_admin_api_client()
     request = admin_v1beta.GetPropertyRequest(
         name=construct_property_rn(property_id)
     )
-    response = client.get_property(request=request)
-    return proto_to_dict(response)
+    response = await client.get_property(request=request)
+    return await asyncio.to_thread(proto_to_dict, response)
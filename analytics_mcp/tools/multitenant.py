@@ -14,10 +14,16 @@
 
 """Multi-tenant tools for Google Analytics that accept tenant credentials."""
 
+import asyncio
 import base64
+import collections
+import contextlib
+import functools
+import hashlib
+import inspect
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 from google.oauth2 import service_account
 from google.analytics import admin_v1beta, data_v1beta
@@ -25,6 +31,7 @@ from google.api_core.gapic_v1.client_info import ClientInfo
 
 from analytics_mcp.coordinator import mcp
 from analytics_mcp.tools.utils import (
+    _drain_pager_prefetch,
     construct_property_rn,
     proto_to_dict,
     _get_package_version_with_fallback
@@ -35,33 +42,337 @@ logger = logging.getLogger(__name__)
 # Read-only scope for Analytics
 _READ_ONLY_ANALYTICS_SCOPE = "https://www.googleapis.com/auth/analytics.readonly"
 
+# Message factories used for every report request.
+_Dim = data_v1beta.Dimension
+_Met = data_v1beta.Metric
 
+# Maximum number of API clients kept alive per client type. Each client owns a
+# gRPC channel, so the least recently used one is evicted once this is
+# exceeded and closed when no call is using it.
+_CLIENT_POOL_SIZE = 64
+
+# Pooled API clients keyed by (tenant ID, credentials digest). Keying on the
+# credentials digest as well as the tenant ID ensures a client is never handed
+# to a caller presenting different credentials for the same tenant.
+_admin_clients: collections.OrderedDict = collections.OrderedDict()
+_data_clients: collections.OrderedDict = collections.OrderedDict()
+_client_pool_lock = asyncio.Lock()
+
+# Background tasks closing evicted clients, referenced until they finish so
+# they aren't garbage collected mid-close.
+_closing_tasks: set = set()
+
+# Maximum number of concurrent requests per tenant, and how long a request
+# waits for a free slot before the tenant is told to slow down.
+_TENANT_MAX_CONCURRENCY = 8
+_TENANT_SLOT_TIMEOUT_SECONDS = 5.0
+
+# Concurrency slots per tenant ID. Entries only exist while a request holds
+# or waits for one of the tenant's slots, so the dict stays bounded by the
+# number of tenants with requests in progress.
+_tenant_sem: Dict[str, "_TenantSlots"] = {}
+
+# Futures for multi-tenant calls in progress, keyed by tool name and arguments.
+_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+class _TenantBusyError(Exception):
+    """Raised when a tenant has no free concurrency slot."""
+
+
+@functools.lru_cache(maxsize=1024)
 def _create_client_info(tenant_id: str) -> ClientInfo:
-    """Create client info with tenant ID for tracking."""
+    """Create client info with tenant ID for tracking.
+
+    The result is cached and shared between requests, so it must not be
+    mutated.
+    """
     return ClientInfo(
         user_agent=f"analytics-mcp/{_get_package_version_with_fallback()}/tenant-{tenant_id}"
     )
 
 
+def _hash_credentials(tenant_credentials: str) -> str:
+    """Returns a short digest identifying a tenant credentials string."""
+    return hashlib.blake2b(
+        tenant_credentials.encode(), digest_size=16
+    ).hexdigest()
+
+
+@functools.lru_cache(maxsize=128)
+def _decode_credentials_cached(
+    cred_hash: str, cred_b64: str
+) -> service_account.Credentials:
+    """Decodes tenant credentials, caching the result by credential digest.
+
+    Reusing the same `Credentials` object across calls also reuses its signer
+    and any access token it has already minted.
+    """
+    # Decode base64
+    cred_json = base64.b64decode(cred_b64).decode('utf-8')
+    cred_data = json.loads(cred_json)
+
+    # Create credentials object
+    return service_account.Credentials.from_service_account_info(
+        cred_data,
+        scopes=[_READ_ONLY_ANALYTICS_SCOPE]
+    )
+
+
 def _decode_credentials(tenant_credentials: str) -> service_account.Credentials:
     """Decode and validate tenant credentials."""
     try:
-        # Decode base64
-        cred_json = base64.b64decode(tenant_credentials).decode('utf-8')
-        cred_data = json.loads(cred_json)
-        
-        # Create credentials object
-        credentials = service_account.Credentials.from_service_account_info(
-            cred_data,
-            scopes=[_READ_ONLY_ANALYTICS_SCOPE]
+        return _decode_credentials_cached(
+            _hash_credentials(tenant_credentials), tenant_credentials
         )
-        return credentials
     except Exception as e:
-        logger.error(f"Failed to decode credentials: {e}")
+        logger.error("Failed to decode credentials: %s", e)
         raise ValueError("Invalid credentials format. Expected base64-encoded service account JSON")
 
 
+# Exposes the cache controls on the public helper, e.g. for tests.
+_decode_credentials.cache_clear = _decode_credentials_cached.cache_clear
+_decode_credentials.cache_info = _decode_credentials_cached.cache_info
+
+
+def _report_query_hash(*query_parts: Any) -> str:
+    """Returns a digest identifying a report query, excluding pagination."""
+    return hashlib.blake2b(
+        json.dumps(query_parts, sort_keys=True, default=str).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _encode_page_token(property_rn: str, query_hash: str, offset: int) -> str:
+    """Returns an opaque token for the report page starting at `offset`.
+
+    The token isn't signed: `offset` is a public parameter anyway, so a
+    forged token grants nothing a caller couldn't already request. Binding
+    it to the query only catches tokens reused with a different report, and
+    lets any server instance accept tokens issued by another.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps([property_rn, query_hash, offset]).encode()
+    ).decode()
+
+
+def _decode_page_token(page_token: str, property_rn: str, query_hash: str) -> int:
+    """Returns the offset encoded in a page token.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for a different
+          property or query.
+    """
+    try:
+        token_property_rn, token_query_hash, offset = json.loads(
+            base64.urlsafe_b64decode(page_token.encode())
+        )
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError("Invalid page_token")
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        raise ValueError("Invalid page_token")
+    if (token_property_rn, token_query_hash) != (property_rn, query_hash):
+        raise ValueError("page_token does not match this report query")
+    return offset
+
+
+class _PooledClient:
+    """A pooled API client and the number of calls currently using it."""
+
+    def __init__(self, client):
+        self.client = client
+        self.in_use = 0
+        self.evicted = False
+
+
+async def _close_client(client) -> None:
+    """Closes an evicted client's transport, logging any failure."""
+    try:
+        await client.transport.close()
+    except Exception as e:
+        logger.warning("Failed to close evicted API client: %s", e)
+
+
+def _close_in_background(client) -> None:
+    """Closes an evicted client without delaying the current request."""
+    task = asyncio.get_running_loop().create_task(_close_client(client))
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+@contextlib.asynccontextmanager
+async def _pooled_client(pool, client_class, tenant_id, tenant_credentials):
+    """Yields a pooled client for the tenant, creating it on a cache miss.
+
+    A client evicted from the pool is only closed once no call is using it,
+    so RPCs already in flight on it are never cut off. The close runs in a
+    background task, so it doesn't add latency to the current request.
+    """
+    key = (tenant_id, _hash_credentials(tenant_credentials))
+    async with _client_pool_lock:
+        entry = pool.get(key)
+        if entry is not None:
+            pool.move_to_end(key)
+        else:
+            entry = _PooledClient(
+                client_class(
+                    credentials=_decode_credentials(tenant_credentials),
+                    client_info=_create_client_info(tenant_id),
+                    transport="grpc_asyncio",
+                )
+            )
+            pool[key] = entry
+            if len(pool) > _CLIENT_POOL_SIZE:
+                _, evicted = pool.popitem(last=False)
+                evicted.evicted = True
+                if evicted.in_use == 0:
+                    _close_in_background(evicted.client)
+        entry.in_use += 1
+    try:
+        yield entry.client
+    finally:
+        entry.in_use -= 1
+        if entry.evicted and entry.in_use == 0:
+            _close_in_background(entry.client)
+
+
+def _admin_client(tenant_id: str, tenant_credentials: str):
+    """Yields the pooled Admin API client for the tenant."""
+    return _pooled_client(
+        _admin_clients,
+        admin_v1beta.AnalyticsAdminServiceAsyncClient,
+        tenant_id,
+        tenant_credentials,
+    )
+
+
+def _data_client(tenant_id: str, tenant_credentials: str):
+    """Yields the pooled Data API client for the tenant."""
+    return _pooled_client(
+        _data_clients,
+        data_v1beta.BetaAnalyticsDataAsyncClient,
+        tenant_id,
+        tenant_credentials,
+    )
+
+
+class _TenantSlots:
+    """A tenant's concurrency slots and the number of requests using them."""
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(_TENANT_MAX_CONCURRENCY)
+        self.users = 0
+
+
+@contextlib.asynccontextmanager
+async def _tenant_slot(tenant_id: str):
+    """Holds one of the tenant's concurrency slots for the duration.
+
+    Raises:
+        _TenantBusyError: If no slot frees up within the timeout.
+    """
+    slots = _tenant_sem.get(tenant_id)
+    if slots is None:
+        slots = _tenant_sem[tenant_id] = _TenantSlots()
+    slots.users += 1
+    try:
+        sem = slots.semaphore
+        if sem.locked():
+            try:
+                await asyncio.wait_for(
+                    sem.acquire(), timeout=_TENANT_SLOT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                raise _TenantBusyError(
+                    f"Too many concurrent requests for tenant {tenant_id}. "
+                    "Retry after pending requests complete."
+                )
+        else:
+            await sem.acquire()
+        try:
+            yield
+        finally:
+            sem.release()
+    finally:
+        slots.users -= 1
+        if not slots.users and _tenant_sem.get(tenant_id) is slots:
+            del _tenant_sem[tenant_id]
+
+
+def _tenant_limited(tool):
+    """Runs a multi-tenant tool in one of the tenant's concurrency slots.
+
+    When the tenant has no free slot, the tool returns a `SLOW_DOWN` error
+    instead of queueing the request indefinitely.
+    """
+    @functools.wraps(tool)
+    async def wrapper(tenant_id, *args, **kwargs):
+        try:
+            async with _tenant_slot(tenant_id):
+                return await tool(tenant_id, *args, **kwargs)
+        except _TenantBusyError as e:
+            return {"error": {"code": "SLOW_DOWN", "message": str(e)}}
+
+    return wrapper
+
+
+def _single_flight(tool):
+    """Shares one execution of a multi-tenant tool between identical calls.
+
+    Calls are identical when they pass the same arguments, including the same
+    tenant credentials. Callers arriving while a call is in progress await
+    its result instead of issuing their own API request. If the caller that
+    issued the request is cancelled, a waiting caller issues it again.
+    """
+    signature = inspect.signature(tool)
+
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments["tenant_credentials"] = _hash_credentials(
+            arguments["tenant_credentials"]
+        )
+        key = (
+            tool.__name__,
+            json.dumps(arguments, sort_keys=True, default=str),
+        )
+
+        while (future := _inflight.get(key)) is not None:
+            try:
+                # Shielded so a cancelled caller doesn't cancel the shared call.
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only this caller's own cancellation propagates. If the
+                # caller running the shared call was cancelled instead, run
+                # the call here (or join whoever already took it over).
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Marks the outcome as retrieved in case no other caller awaits it.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        _inflight[key] = future
+        try:
+            result = await tool(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del _inflight[key]
+
+    return wrapper
+
+
 @mcp.tool()
+@_single_flight
+@_tenant_limited
 async def get_account_summaries_mt(
     tenant_id: str,
     tenant_credentials: str
@@ -72,20 +383,111 @@ async def get_account_summaries_mt(
         tenant_id: Unique identifier for the tenant
         tenant_credentials: Base64-encoded service account JSON credentials
     """
-    credentials = _decode_credentials(tenant_credentials)
-    client = admin_v1beta.AnalyticsAdminServiceAsyncClient(
-        credentials=credentials,
-        client_info=_create_client_info(tenant_id)
+    async with _admin_client(tenant_id, tenant_credentials) as client:
+        summary_pager = await client.list_account_summaries()
+        all_pages = [
+            proto_to_dict(summary_page)
+            async for summary_page in _drain_pager_prefetch(
+                summary_pager, "account_summaries"
+            )
+        ]
+    return all_pages
+
+
+async def _fetch_report_mt(
+    tenant_id: str,
+    tenant_credentials: str,
+    property_id: int | str,
+    date_ranges: List[Dict[str, str]],
+    dimensions: List[str] = None,
+    metrics: List[str] = None,
+    dimension_filter: Dict[str, Any] = None,
+    metric_filter: Dict[str, Any] = None,
+    order_bys: List[Dict[str, Any]] = None,
+    limit: int = None,
+    offset: int = None,
+    page_size: int = 10000,
+    page_token: str = None
+):
+    """Runs a report for `run_report_mt`.
+
+    Returns:
+        The report response and the token for the next page, or None if this
+        is the last page.
+    """
+    property_rn = construct_property_rn(property_id)
+    query_hash = _report_query_hash(
+        date_ranges, dimensions, metrics, dimension_filter, metric_filter,
+        order_bys
     )
+    if page_token:
+        if offset is not None:
+            raise ValueError("Specify either offset or page_token, not both")
+        offset = _decode_page_token(page_token, property_rn, query_hash)
+    if limit is None:
+        limit = page_size
     
-    summary_pager = await client.list_account_summaries()
-    all_pages = [
-        proto_to_dict(summary_page) async for summary_page in summary_pager
-    ]
-    return all_pages
+    # Build the request in a single constructor call
+    kwargs = {
+        "property": property_rn,
+        "date_ranges": [data_v1beta.DateRange(**dr) for dr in date_ranges],
+        "limit": limit,
+    }
+    
+    if dimensions:
+        kwargs["dimensions"] = [_Dim(name=d) for d in dimensions]
+    
+    if metrics:
+        kwargs["metrics"] = [_Met(name=m) for m in metrics]
+    
+    if dimension_filter:
+        kwargs["dimension_filter"] = data_v1beta.FilterExpression(**dimension_filter)
+    
+    if metric_filter:
+        kwargs["metric_filter"] = data_v1beta.FilterExpression(**metric_filter)
+    
+    if order_bys:
+        kwargs["order_bys"] = [data_v1beta.OrderBy(**ob) for ob in order_bys]
+    
+    if offset is not None:
+        kwargs["offset"] = offset
+    
+    request = data_v1beta.RunReportRequest(**kwargs)
+    
+    # Execute the report
+    async with _data_client(tenant_id, tenant_credentials) as client:
+        response = await client.run_report(request)
+    next_page_token = None
+    next_offset = (offset or 0) + len(response.rows)
+    if response.rows and next_offset < response.row_count:
+        next_page_token = _encode_page_token(
+            property_rn, query_hash, next_offset
+        )
+    return response, next_page_token
+
+
+def _report_header(response: data_v1beta.RunReportResponse) -> Dict[str, Any]:
+    """Returns a report response as a dict, without its rows.
+
+    Only the fields other than `rows` are copied, so a large page isn't
+    duplicated in memory.
+    """
+    response_pb = data_v1beta.RunReportResponse.pb(response)
+    header_pb = type(response_pb)(
+        **{
+            field.name: value
+            for field, value in response_pb.ListFields()
+            if field.name != "rows"
+        }
+    )
+    header = proto_to_dict(data_v1beta.RunReportResponse.wrap(header_pb))
+    del header["rows"]
+    return header
 
 
 @mcp.tool()
+@_single_flight
+@_tenant_limited
 async def run_report_mt(
     tenant_id: str,
     tenant_credentials: str,
@@ -97,11 +499,15 @@ async def run_report_mt(
     metric_filter: Dict[str, Any] = None,
     order_bys: List[Dict[str, Any]] = None,
     limit: int = None,
-    offset: int = None
+    offset: int = None,
+    page_size: int = 10000,
+    page_token: str = None
 ) -> Dict[str, Any]:
     """Runs a Google Analytics report using tenant-specific credentials.
     
     This multi-tenant version requires tenant credentials for data isolation.
+    Results are paginated: when more rows are available the response includes
+    a `next_page_token` to pass back as `page_token` with the same query.
     
     Args:
         tenant_id: Unique identifier for the tenant
@@ -113,48 +519,57 @@ async def run_report_mt(
         dimension_filter: Filter for dimensions
         metric_filter: Filter for metrics
         order_bys: Sorting configuration
-        limit: Maximum number of rows to return
-        offset: Number of rows to skip
+        limit: Maximum number of rows to return, overriding page_size
+        offset: Number of rows to skip. Can't be combined with page_token
+        page_size: Maximum number of rows to return per page
+        page_token: Token from a previous response's `next_page_token`
     """
-    credentials = _decode_credentials(tenant_credentials)
-    client = data_v1beta.BetaAnalyticsDataAsyncClient(
-        credentials=credentials,
-        client_info=_create_client_info(tenant_id)
+    response, next_page_token = await _fetch_report_mt(
+        tenant_id, tenant_credentials, property_id, date_ranges,
+        dimensions=dimensions, metrics=metrics,
+        dimension_filter=dimension_filter, metric_filter=metric_filter,
+        order_bys=order_bys, limit=limit, offset=offset,
+        page_size=page_size, page_token=page_token
     )
-    
-    # Build the request
-    request = data_v1beta.RunReportRequest(
-        property=construct_property_rn(property_id),
-        date_ranges=[data_v1beta.DateRange(**dr) for dr in date_ranges]
-    )
-    
-    if dimensions:
-        request.dimensions = [data_v1beta.Dimension(name=d) for d in dimensions]
-    
-    if metrics:
-        request.metrics = [data_v1beta.Metric(name=m) for m in metrics]
-    
-    if dimension_filter:
-        request.dimension_filter = data_v1beta.FilterExpression(**dimension_filter)
-    
-    if metric_filter:
-        request.metric_filter = data_v1beta.FilterExpression(**metric_filter)
-    
-    if order_bys:
-        request.order_bys = [data_v1beta.OrderBy(**ob) for ob in order_bys]
-    
-    if limit is not None:
-        request.limit = limit
-    
-    if offset is not None:
-        request.offset = offset
-    
-    # Execute the report
-    response = await client.run_report(request)
-    return proto_to_dict(response)
+    # Converting a large report is CPU-bound, so it runs in a worker thread to
+    # keep the event loop free for other tenants.
+    result = await asyncio.to_thread(proto_to_dict, response)
+    if next_page_token:
+        result["next_page_token"] = next_page_token
+    return result
+
+
+async def stream_report_mt(
+    tenant_id: str, tenant_credentials: str, **kwargs: Any
+) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """Runs a report like `run_report_mt`, converting rows as they're consumed.
+
+    Accepts the same arguments as `run_report_mt`. Rows are converted one at
+    a time by the returned iterator, so a caller can start sending rows
+    without first converting the whole report.
+
+    Returns:
+        The result without `rows` (including `next_page_token` when more
+        rows are available), and an iterator over the rows as dicts. When the
+        tenant is busy, the first item is a `SLOW_DOWN` error and there are no
+        rows.
+    """
+    try:
+        async with _tenant_slot(tenant_id):
+            response, next_page_token = await _fetch_report_mt(
+                tenant_id, tenant_credentials, **kwargs
+            )
+    except _TenantBusyError as e:
+        return {"error": {"code": "SLOW_DOWN", "message": str(e)}}, iter(())
+    header = await asyncio.to_thread(_report_header, response)
+    if next_page_token:
+        header["next_page_token"] = next_page_token
+    return header, (proto_to_dict(row) for row in response.rows)
 
 
 @mcp.tool()
+@_single_flight
+@_tenant_limited
 async def run_realtime_report_mt(
     tenant_id: str,
     tenant_credentials: str,
@@ -177,36 +592,33 @@ async def run_realtime_report_mt(
         metric_filter: Filter for metrics
         limit: Maximum number of rows to return
     """
-    credentials = _decode_credentials(tenant_credentials)
-    client = data_v1beta.BetaAnalyticsDataAsyncClient(
-        credentials=credentials,
-        client_info=_create_client_info(tenant_id)
-    )
-    
-    request = data_v1beta.RunRealtimeReportRequest(
-        property=construct_property_rn(property_id)
-    )
+    kwargs = {"property": construct_property_rn(property_id)}
     
     if dimensions:
-        request.dimensions = [data_v1beta.Dimension(name=d) for d in dimensions]
+        kwargs["dimensions"] = [_Dim(name=d) for d in dimensions]
     
     if metrics:
-        request.metrics = [data_v1beta.Metric(name=m) for m in metrics]
+        kwargs["metrics"] = [_Met(name=m) for m in metrics]
     
     if dimension_filter:
-        request.dimension_filter = data_v1beta.FilterExpression(**dimension_filter)
+        kwargs["dimension_filter"] = data_v1beta.FilterExpression(**dimension_filter)
     
     if metric_filter:
-        request.metric_filter = data_v1beta.FilterExpression(**metric_filter)
+        kwargs["metric_filter"] = data_v1beta.FilterExpression(**metric_filter)
     
     if limit is not None:
-        request.limit = limit
+        kwargs["limit"] = limit
     
-    response = await client.run_realtime_report(request)
-    return proto_to_dict(response)
+    request = data_v1beta.RunRealtimeReportRequest(**kwargs)
+    
+    async with _data_client(tenant_id, tenant_credentials) as client:
+        response = await client.run_realtime_report(request)
+    return await asyncio.to_thread(proto_to_dict, response)
 
 
 @mcp.tool()
+@_single_flight
+@_tenant_limited
 async def get_property_details_mt(
     tenant_id: str,
     tenant_credentials: str,
@@ -219,14 +631,179 @@ async def get_property_details_mt(
         tenant_credentials: Base64-encoded service account JSON credentials
         property_id: The Google Analytics property ID
     """
-    credentials = _decode_credentials(tenant_credentials)
-    client = admin_v1beta.AnalyticsAdminServiceAsyncClient(
-        credentials=credentials,
-        client_info=_create_client_info(tenant_id)
-    )
-    
     request = admin_v1beta.GetPropertyRequest(
         name=construct_property_rn(property_id)
     )
-    response = await client.get_property(request=request)
-    return proto_to_dict(response)
\ No newline at end of file
+    async with _admin_client(tenant_id, tenant_credentials) as client:
+        response = await client.get_property(request=request)
+    return await asyncio.to_thread(proto_to_dict, response)
+
+
+# Tools that can be invoked as sub-calls of `batch_mt`. The undecorated tools
+# are used so `batch_mt` can report a busy tenant as a sub-call error.
+_BATCH_TOOLS = {
+    "get_account_summaries_mt": inspect.unwrap(get_account_summaries_mt),
+    "run_report_mt": inspect.unwrap(run_report_mt),
+    "run_realtime_report_mt": inspect.unwrap(run_realtime_report_mt),
+    "get_property_details_mt": inspect.unwrap(get_property_details_mt),
+}
+
+
+def _batch_error(code: str, message: str) -> Dict[str, Any]:
+    """Returns the outcome recorded for a failed batch sub-call."""
+    return {"error": {"code": code, "message": message}}
+
+
+def _batch_dependencies(call: Dict[str, Any]) -> List[str]:
+    """Returns the IDs of the calls whose results feed into `call`."""
+    input_from = call.get("input_from") or {}
+    return [reference.split(".")[0] for reference in input_from.values()]
+
+
+def _batch_layers(calls: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Groups batch calls into layers using a topological sort on `input_from`.
+
+    Every call only depends on calls in earlier layers, so the calls within a
+    layer can run concurrently.
+
+    Raises:
+        ValueError: If a call is malformed, references an unknown call, or the
+          calls contain a dependency cycle.
+    """
+    if not isinstance(calls, list):
+        raise ValueError("calls must be a list of call dicts")
+    calls_by_id = {}
+    for call in calls:
+        if not isinstance(call, dict):
+            raise ValueError(f"Invalid call: {call!r}. Calls must be dicts.")
+        call_id = call.get("id")
+        if not isinstance(call_id, str) or not call_id or "." in call_id:
+            raise ValueError(
+                f"Invalid call ID: {call_id!r}. Call IDs must be non-empty "
+                "strings without '.'."
+            )
+        if call_id in calls_by_id:
+            raise ValueError(f"Duplicate call ID: {call_id}")
+        if call.get("tool") not in _BATCH_TOOLS:
+            raise ValueError(
+                f"Unsupported tool for call {call_id}: {call.get('tool')}"
+            )
+        if not isinstance(call.get("args") or {}, dict):
+            raise ValueError(f"args for call {call_id} must be a dict")
+        input_from = call.get("input_from") or {}
+        if not isinstance(input_from, dict) or not all(
+            isinstance(reference, str) for reference in input_from.values()
+        ):
+            raise ValueError(
+                f"input_from for call {call_id} must map argument names to "
+                "reference strings"
+            )
+        calls_by_id[call_id] = call
+
+    pending = {}
+    for call_id, call in calls_by_id.items():
+        dependencies = set(_batch_dependencies(call))
+        unknown = dependencies - calls_by_id.keys()
+        if unknown:
+            raise ValueError(
+                f"Call {call_id} takes input from unknown calls: "
+                f"{sorted(unknown)}"
+            )
+        pending[call_id] = dependencies
+
+    layers = []
+    done = set()
+    while pending:
+        ready = [
+            call_id
+            for call_id, dependencies in pending.items()
+            if dependencies <= done
+        ]
+        if not ready:
+            raise ValueError(
+                f"Dependency cycle between calls: {sorted(pending)}"
+            )
+        layers.append([calls_by_id[call_id] for call_id in ready])
+        done.update(ready)
+        for call_id in ready:
+            del pending[call_id]
+    return layers
+
+
+def _resolve_batch_reference(
+    outcomes: Dict[str, Dict[str, Any]], reference: str
+) -> Any:
+    """Resolves a `<call id>[.<key or index>...]` reference to a value."""
+    call_id, *path = reference.split(".")
+    value = outcomes[call_id]["result"]
+    for part in path:
+        value = value[int(part)] if isinstance(value, list) else value[part]
+    return value
+
+
+@mcp.tool()
+async def batch_mt(
+    tenant_id: str,
+    tenant_credentials: str,
+    calls: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Runs several multi-tenant tools in one request using tenant credentials.
+
+    Calls may take arguments from the results of other calls in the same
+    batch, so dependent lookups such as "list properties, then report on the
+    first one" need a single round trip. Independent calls run concurrently.
+
+    Args:
+        tenant_id: Unique identifier for the tenant
+        tenant_credentials: Base64-encoded service account JSON credentials
+        calls: List of calls to run. Each call is a dict with:
+          - id: Unique identifier for the call within the batch
+          - tool: Name of the multi-tenant tool to run, e.g. `run_report_mt`
+          - args: Arguments for the tool, excluding `tenant_id` and
+            `tenant_credentials`
+          - input_from: Optional mapping of argument name to a reference of
+            the form `<call id>.<key or index>...` into another call's result,
+            e.g. `{"property_id": "accounts.0.property_summaries.0.property"}`
+
+    Returns:
+        A dict keyed by call ID. Each value holds either the call's `result`
+        or an `error` with a `code` and `message`. Calls whose inputs come
+        from a failed call fail with `INVALID_ARGUMENT`.
+    """
+    outcomes = {}
+
+    async def dispatch(call):
+        call_id = call["id"]
+        for dependency in _batch_dependencies(call):
+            if "error" in outcomes[dependency]:
+                return call_id, _batch_error(
+                    "INVALID_ARGUMENT", f"Input call {dependency} failed"
+                )
+        args = dict(call.get("args") or {})
+        try:
+            for name, reference in (call.get("input_from") or {}).items():
+                args[name] = _resolve_batch_reference(outcomes, reference)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            return call_id, _batch_error(
+                "INVALID_ARGUMENT", f"Could not resolve input_from: {e!r}"
+            )
+        try:
+            async with _tenant_slot(tenant_id):
+                result = await _BATCH_TOOLS[call["tool"]](
+                    tenant_id, tenant_credentials, **args
+                )
+        except _TenantBusyError as e:
+            return call_id, _batch_error("SLOW_DOWN", str(e))
+        except (TypeError, ValueError) as e:
+            return call_id, _batch_error("INVALID_ARGUMENT", str(e))
+        except Exception as e:
+            logger.error("Batch call %s failed: %s", call_id, e)
+            return call_id, _batch_error("INTERNAL", str(e))
+        return call_id, {"result": result}
+
+    for layer in _batch_layers(calls):
+        for call_id, outcome in await asyncio.gather(
+            *[dispatch(call) for call in layer]
+        ):
+            outcomes[call_id] = outcome
+    return outcomes
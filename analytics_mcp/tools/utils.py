@@ -14,7 +14,10 @@
 
 """Common utilities used by the MCP server."""
 
-from typing import Any, Dict
+import asyncio
+import functools
+import re
+from typing import Any, AsyncIterator, Dict
 
 from google.analytics import admin_v1beta, data_v1beta
 from google.api_core.gapic_v1.client_info import ClientInfo
@@ -23,6 +26,7 @@ import google.auth
 import proto
 
 
+@functools.lru_cache(maxsize=1)
 def _get_package_version_with_fallback():
     """Returns the version of the package.
 
@@ -43,8 +47,16 @@ _READ_ONLY_ANALYTICS_SCOPE = (
 )
 
 
+# Matches a property number, optionally prefixed with 'properties/'.
+_PROPERTY_RE = re.compile(r"(?:properties/)?(\d+)")
+
+
+@functools.lru_cache(maxsize=1)
 def _create_credentials() -> google.auth.credentials.Credentials:
-    """Returns Application Default Credentials with read-only scope."""
+    """Returns Application Default Credentials with read-only scope.
+
+    The credentials are cached so every client shares one access token.
+    """
     (credentials, _) = google.auth.default(scopes=[_READ_ONLY_ANALYTICS_SCOPE])
     return credentials
 
@@ -59,6 +71,19 @@ def create_admin_api_client() -> admin_v1beta.AnalyticsAdminServiceAsyncClient:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_shared_admin_api_client() -> (
+    admin_v1beta.AnalyticsAdminServiceAsyncClient
+):
+    """Returns the shared Admin API async client, creating it on first use.
+
+    Reusing the client avoids credential discovery and a new gRPC channel on
+    every call. Tools only call this from the event loop thread, so no lock is
+    needed around the first construction.
+    """
+    return create_admin_api_client()
+
+
 def create_data_api_client() -> data_v1beta.BetaAnalyticsDataAsyncClient:
     """Returns a properly configured Google Analytics Data API async client.
 
@@ -71,18 +96,18 @@ def create_data_api_client() -> data_v1beta.BetaAnalyticsDataAsyncClient:
 
 def construct_property_rn(property_value: int | str) -> str:
     """Returns a property resource name in the format required by APIs."""
-    property_num = None
-    if isinstance(property_value, int):
-        property_num = property_value
-    elif isinstance(property_value, str):
-        property_value = property_value.strip()
-        if property_value.isdigit():
-            property_num = int(property_value)
-        elif property_value.startswith("properties/"):
-            numeric_part = property_value.split("/")[-1]
-            if numeric_part.isdigit():
-                property_num = int(numeric_part)
-    if property_num is None:
+    return _construct_property_rn(str(property_value).strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _construct_property_rn(property_value: str) -> str:
+    """Returns the resource name for a normalized property value.
+
+    Cached separately from `construct_property_rn` so the cache key is always
+    a string, whatever type the caller passed.
+    """
+    match = _PROPERTY_RE.fullmatch(property_value)
+    if match is None:
         raise ValueError(
             (
                 f"Invalid property ID: {property_value}. "
@@ -91,7 +116,44 @@ def construct_property_rn(property_value: int | str) -> str:
             )
         )
 
-    return f"properties/{property_num}"
+    return f"properties/{int(match.group(1))}"
+
+
+async def _drain_pager_prefetch(
+    pager: Any, items_field: str, depth: int = 4
+) -> AsyncIterator[proto.Message]:
+    """Yields the items of an async pager while prefetching later pages.
+
+    A background task fetches up to `depth` pages ahead, so converting the
+    items of one page overlaps with the round trip for the next.
+
+    Args:
+        pager: An async pager returned by a GAPIC `list_*` method.
+        items_field: The repeated field of each page holding the items, such
+          as `account_summaries`.
+        depth: The maximum number of fetched pages waiting to be consumed.
+    """
+    queue = asyncio.Queue(maxsize=depth)
+    done = object()
+
+    async def produce():
+        try:
+            async for page in pager.pages:
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (page := await queue.get()) is not done:
+            if isinstance(page, Exception):
+                raise page
+            for item in getattr(page, items_field):
+                yield item
+    finally:
+        producer.cancel()
 
 
 def proto_to_dict(obj: proto.Message) -> Dict[str, Any]:
@@ -97,6 +97,41 @@ class TenantAnalyticsService:
             metrics=["activeUsers", "sessions", "screenPageViews"]
         )
     
+    async def run_first_property_report(self, tenant_id: str):
+        """Run a basic report on the tenant's first property in one request
+
+        Uses batch_mt so listing the properties and reporting on the first
+        one costs a single round trip to the MCP server.
+        """
+        credentials = self._get_tenant_credentials(tenant_id)
+        
+        return await self.mcp_client.call_tool(
+            "batch_mt",
+            tenant_id=tenant_id,
+            tenant_credentials=credentials,
+            calls=[
+                {
+                    "id": "accounts",
+                    "tool": "get_account_summaries_mt",
+                },
+                {
+                    "id": "report",
+                    "tool": "run_report_mt",
+                    "args": {
+                        "date_ranges": [{
+                            "start_date": "30daysAgo",
+                            "end_date": "today"
+                        }],
+                        "dimensions": ["date", "country"],
+                        "metrics": ["activeUsers", "sessions"]
+                    },
+                    "input_from": {
+                        "property_id": "accounts.0.property_summaries.0.property"
+                    }
+                }
+            ]
+        )
+    
     async def get_realtime_users(self, tenant_id: str, property_id: str):
         """Get realtime active users for a tenant's property"""
         credentials = self._get_tenant_credentials(tenant_id)
@@ -1,17 +1,23 @@
 #!/usr/bin/env python
 """Simple HTTP server wrapper for MCP with SSE transport."""
 
+import asyncio
+import concurrent.futures
+import inspect
+import logging
 import os
 import sys
 import json
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterator, Tuple
 
 # Add app to path
 sys.path.insert(0, '/app')
 
 # Import FastAPI (lighter than Starlette for our needs)
 from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from google.auth.transport.requests import Request as AuthRequest
+import orjson
 import uvicorn
 
 # Import MCP coordinator and tools
@@ -20,32 +26,125 @@ from analytics_mcp.tools.admin import info  # noqa: F401
 from analytics_mcp.tools.reporting import realtime  # noqa: F401
 from analytics_mcp.tools.reporting import core  # noqa: F401
 from analytics_mcp.tools import multitenant  # noqa: F401
+from analytics_mcp.tools.utils import (
+    _create_credentials,
+    get_shared_admin_api_client,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tool functions and their signatures, resolved once at import time so each
+# request is a dict lookup plus a signature bind.
+_DISPATCH: Dict[str, Tuple[Callable[..., Any], inspect.Signature]] = {
+    tool.name: (tool.fn, inspect.signature(tool.fn))
+    for tool in mcp._tool_manager.list_tools()
+}
+
+# Tools whose report rows are streamed as NDJSON when the client sends
+# `Accept: application/x-ndjson`, mapped to the function that returns the
+# result without rows plus an iterator that converts rows on demand.
+_STREAMING_TOOLS = {"run_report_mt": multitenant.stream_report_mt}
+
+
+def _ndjson_lines(
+    header: Dict[str, Any], rows: Iterator[Dict[str, Any]], request_id: Any
+) -> Iterator[bytes]:
+    """Yields the JSON-RPC envelope without rows, then one line per row."""
+    yield orjson.dumps({"jsonrpc": "2.0", "result": header, "id": request_id})
+    yield b"\n"
+    for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Returns `content` serialized with orjson as a JSON response."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+# Upper bound on the default thread pool size unless EXECUTOR_MAX_WORKERS is
+# set explicitly.
+_EXECUTOR_MAX_WORKERS_CAP = 8
+
+# How long startup waits for the shared Admin API channel to connect.
+_WARMUP_TIMEOUT_SECONDS = 10.0
 
 # Create FastAPI app
 app = FastAPI(title="Google Analytics MCP Server")
 
+def _executor_workers() -> int:
+    """Returns the thread pool size for offloaded work.
+
+    `EXECUTOR_MAX_WORKERS` overrides the default. Otherwise the pool gets two
+    threads per CPU this process may run on, capped at
+    `_EXECUTOR_MAX_WORKERS_CAP`. Containers often report the host's CPUs
+    rather than their quota, and proto conversion holds the GIL, so more
+    threads than that only add memory.
+    """
+    configured = os.getenv("EXECUTOR_MAX_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(_EXECUTOR_MAX_WORKERS_CAP, cpus * 2)
+
+@app.on_event("startup")
+async def configure_executor():
+    """Sizes the thread pool for offloaded work such as proto conversion."""
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=_executor_workers())
+    )
+
+@app.on_event("startup")
+async def warmup():
+    """Connects the shared Admin API client and mints an ADC access token.
+
+    Creating a client only sets up a lazy gRPC channel, so this also waits for
+    the channel to connect, moving the TCP and TLS handshakes and the token
+    fetch off the first request. Failures are only logged, since multi-tenant
+    deployments may not have ADC.
+    """
+    try:
+        client = get_shared_admin_api_client()
+        await asyncio.wait_for(
+            client.transport.grpc_channel.channel_ready(),
+            timeout=_WARMUP_TIMEOUT_SECONDS
+        )
+        await asyncio.to_thread(_create_credentials().refresh, AuthRequest())
+    except Exception as e:
+        logger.warning("Skipping warmup: %s", e)
+
+# Static responses for the info and health endpoints, encoded once at import
+# time since Cloud Run health checks hit them frequently.
+_ROOT_JSON = orjson.dumps({
+    "service": "Google Analytics MCP Server",
+    "status": "running",
+    "tools": [
+        "get_account_summaries",
+        "get_account_summaries_mt",
+        "run_report",
+        "run_report_mt",
+        "run_realtime_report",
+        "run_realtime_report_mt",
+        "get_property_details",
+        "get_property_details_mt",
+        "batch_mt"
+    ]
+})
+_HEALTH_JSON = orjson.dumps({"status": "healthy"})
+
 @app.get("/")
 async def root():
     """Root endpoint with service info."""
-    return {
-        "service": "Google Analytics MCP Server",
-        "status": "running",
-        "tools": [
-            "get_account_summaries",
-            "get_account_summaries_mt",
-            "run_report", 
-            "run_report_mt",
-            "run_realtime_report",
-            "run_realtime_report_mt",
-            "get_property_details",
-            "get_property_details_mt"
-        ]
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health():
     """Health check for Cloud Run."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 @app.post("/")
 async def handle_mcp_request(request: Request):
@@ -59,9 +158,9 @@ async def handle_mcp_request(request: Request):
         request_id = body.get("id")
         
         # Get the tool function
-        tool_func = mcp._tools.get(method)
-        if not tool_func:
-            return JSONResponse(
+        tool = _DISPATCH.get(method)
+        if not tool:
+            return _json_response(
                 content={
                     "jsonrpc": "2.0",
                     "error": {
@@ -72,17 +171,48 @@ async def handle_mcp_request(request: Request):
                 },
                 status_code=200
             )
+        tool_func, signature = tool
+        
+        # Validate params against the tool signature
+        try:
+            bound = signature.bind(**params)
+        except TypeError as e:
+            return _json_response(
+                content={
+                    "jsonrpc": "2.0",
+                    "error": {
+                        "code": -32602,
+                        "message": f"Invalid params: {e}"
+                    },
+                    "id": request_id
+                },
+                status_code=200
+            )
         
         # Execute the tool
         try:
-            result = await tool_func(**params)
-            return {
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            }
+            stream_func = _STREAMING_TOOLS.get(method)
+            if (
+                stream_func
+                and "application/x-ndjson" in request.headers.get("accept", "")
+            ):
+                header, rows = await stream_func(**bound.arguments)
+                return StreamingResponse(
+                    content=_ndjson_lines(header, rows, request_id),
+                    media_type="application/x-ndjson"
+                )
+            result = tool_func(*bound.args, **bound.kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return _json_response(
+                content={
+                    "jsonrpc": "2.0",
+                    "result": result,
+                    "id": request_id
+                }
+            )
         except Exception as e:
-            return JSONResponse(
+            return _json_response(
                 content={
                     "jsonrpc": "2.0",
                     "error": {
@@ -95,7 +225,7 @@ async def handle_mcp_request(request: Request):
             )
             
     except Exception as e:
-        return JSONResponse(
+        return _json_response(
             content={
                 "jsonrpc": "2.0",
                 "error": {
@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the admin info module."""
+
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from google.analytics import admin_v1beta
+
+from analytics_mcp.tools.admin import info
+
+
+class _FakeAdminClient:
+    """Returns pagers holding the first page of each list call."""
+
+    def __init__(self, next_page_token):
+        self.next_page_token = next_page_token
+        self.requests = []
+
+    async def list_account_summaries(self, request):
+        self.requests.append(request)
+        return types.SimpleNamespace(
+            account_summaries=[
+                admin_v1beta.AccountSummary(account="accounts/1"),
+                admin_v1beta.AccountSummary(account="accounts/2"),
+            ],
+            next_page_token=self.next_page_token,
+        )
+
+    async def list_google_ads_links(self, request):
+        self.requests.append(request)
+        return types.SimpleNamespace(
+            google_ads_links=[
+                admin_v1beta.GoogleAdsLink(customer_id="123-456-7890")
+            ],
+            next_page_token=self.next_page_token,
+        )
+
+
+class TestInfo(unittest.TestCase):
+    """Test cases for the admin info module."""
+
+    def test_get_account_summaries(self):
+        """Tests that one page of summaries is returned with its token."""
+        client = _FakeAdminClient(next_page_token="page-2")
+        with mock.patch.object(
+            info, "get_shared_admin_api_client", return_value=client
+        ):
+            result = asyncio.run(
+                info.get_account_summaries(page_size=2, page_token="page-1")
+            )
+
+        self.assertEqual(
+            [item["account"] for item in result["items"]],
+            ["accounts/1", "accounts/2"],
+        )
+        self.assertEqual(result["next_page_token"], "page-2")
+        self.assertEqual(client.requests[0].page_size, 2)
+        self.assertEqual(client.requests[0].page_token, "page-1")
+
+    def test_get_account_summaries_last_page(self):
+        """Tests that the last page has no next_page_token."""
+        client = _FakeAdminClient(next_page_token="")
+        with mock.patch.object(
+            info, "get_shared_admin_api_client", return_value=client
+        ):
+            result = asyncio.run(info.get_account_summaries())
+
+        self.assertEqual(len(result["items"]), 2)
+        self.assertIsNone(result["next_page_token"])
+
+    def test_list_google_ads_links_last_page(self):
+        """Tests that links are returned as one page of items."""
+        client = _FakeAdminClient(next_page_token="")
+        with mock.patch.object(
+            info, "get_shared_admin_api_client", return_value=client
+        ):
+            result = asyncio.run(info.list_google_ads_links("properties/1"))
+
+        self.assertEqual(
+            [item["customer_id"] for item in result["items"]],
+            ["123-456-7890"],
+        )
+        self.assertIsNone(result["next_page_token"])
+        self.assertEqual(client.requests[0].parent, "properties/1")
@@ -0,0 +1,559 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the multitenant module."""
+
+import asyncio
+import base64
+import contextlib
+import json
+import unittest
+from unittest import mock
+
+from google.analytics import data_v1beta
+
+from analytics_mcp.tools import multitenant
+
+
+def _encode(data):
+    return base64.b64encode(json.dumps(data).encode()).decode()
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self, **kwargs):
+        self.transport = _FakeTransport()
+
+
+class _FakeDataClient:
+    """Returns `row_count` report rows, honoring offset and limit."""
+
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.requests = []
+
+    async def run_report(self, request):
+        self.requests.append(request)
+        end = min(request.offset + request.limit, self.row_count)
+        return data_v1beta.RunReportResponse(
+            dimension_headers=[data_v1beta.DimensionHeader(name="country")],
+            rows=[
+                data_v1beta.Row(
+                    dimension_values=[data_v1beta.DimensionValue(value=str(i))]
+                )
+                for i in range(request.offset, end)
+            ],
+            row_count=self.row_count,
+        )
+
+
+def _patch_data_client(client):
+    @contextlib.asynccontextmanager
+    async def data_client(tenant_id, tenant_credentials):
+        yield client
+
+    return mock.patch.object(multitenant, "_data_client", data_client)
+
+
+class TestMultitenant(unittest.TestCase):
+    """Test cases for the multitenant module."""
+
+    def setUp(self):
+        multitenant._decode_credentials.cache_clear()
+
+    def test_decode_credentials_is_cached(self):
+        """Tests that identical credentials are only decoded once."""
+        with mock.patch.object(
+            multitenant.service_account.Credentials,
+            "from_service_account_info",
+            side_effect=lambda *args, **kwargs: object(),
+        ) as factory:
+            first = multitenant._decode_credentials(_encode({"a": 1}))
+            second = multitenant._decode_credentials(_encode({"a": 1}))
+            third = multitenant._decode_credentials(_encode({"a": 2}))
+
+        self.assertIs(first, second, "Same credentials should be reused")
+        self.assertIsNot(first, third, "Different credentials should differ")
+        self.assertEqual(factory.call_count, 2)
+
+    def test_decode_credentials_invalid_input(self):
+        """Tests that malformed credentials raise a ValueError."""
+        with self.assertRaises(ValueError, msg="Non-base64 input should fail"):
+            multitenant._decode_credentials("not base64!")
+        with self.assertRaises(ValueError, msg="Non-JSON input should fail"):
+            multitenant._decode_credentials(
+                base64.b64encode(b"not json").decode()
+            )
+
+    def test_pooled_client(self):
+        """Tests that clients are reused per tenant and credentials."""
+        with mock.patch.object(
+            multitenant, "_decode_credentials"
+        ), mock.patch.dict(multitenant._data_clients, clear=True):
+
+            async def run():
+                async with multitenant._pooled_client(
+                    multitenant._data_clients, _FakeClient, "t1", "a"
+                ) as first:
+                    pass
+                async with multitenant._pooled_client(
+                    multitenant._data_clients, _FakeClient, "t1", "a"
+                ) as second:
+                    pass
+                async with multitenant._pooled_client(
+                    multitenant._data_clients, _FakeClient, "t1", "b"
+                ) as other:
+                    pass
+                return first, second, other
+
+            first, second, other = asyncio.run(run())
+
+        self.assertIs(first, second, "Same credentials should hit the pool")
+        self.assertIsNot(
+            first, other, "Different credentials should get another client"
+        )
+
+    def test_pooled_client_eviction_waits_for_idle(self):
+        """Tests that an evicted client is only closed once it's idle."""
+        with mock.patch.object(
+            multitenant, "_decode_credentials"
+        ), mock.patch.object(
+            multitenant, "_CLIENT_POOL_SIZE", 1
+        ), mock.patch.dict(multitenant._data_clients, clear=True):
+
+            async def run():
+                async with multitenant._pooled_client(
+                    multitenant._data_clients, _FakeClient, "t1", "a"
+                ) as busy:
+                    async with multitenant._pooled_client(
+                        multitenant._data_clients, _FakeClient, "t2", "a"
+                    ) as idle:
+                        pass
+                    await asyncio.gather(*multitenant._closing_tasks)
+                    self.assertFalse(
+                        busy.transport.closed, "In-use client was closed"
+                    )
+                await asyncio.gather(*multitenant._closing_tasks)
+                self.assertTrue(
+                    busy.transport.closed, "Evicted client wasn't closed"
+                )
+                async with multitenant._pooled_client(
+                    multitenant._data_clients, _FakeClient, "t3", "a"
+                ):
+                    pass
+                await asyncio.gather(*multitenant._closing_tasks)
+                self.assertTrue(
+                    idle.transport.closed, "Idle evicted client wasn't closed"
+                )
+
+            asyncio.run(run())
+
+    def test_pooled_client_close_failure(self):
+        """Tests that a failing close is logged, not raised to the caller."""
+
+        class _FailingTransport:
+            async def close(self):
+                raise RuntimeError("close failed")
+
+        class _FailingClient:
+            def __init__(self, **kwargs):
+                self.transport = _FailingTransport()
+
+        with mock.patch.object(
+            multitenant, "_decode_credentials"
+        ), mock.patch.object(
+            multitenant, "_CLIENT_POOL_SIZE", 1
+        ), mock.patch.dict(multitenant._data_clients, clear=True):
+
+            async def run():
+                for tenant_id in ("t1", "t2"):
+                    async with multitenant._pooled_client(
+                        multitenant._data_clients,
+                        _FailingClient,
+                        tenant_id,
+                        "a",
+                    ):
+                        pass
+                await asyncio.gather(*multitenant._closing_tasks)
+
+            with self.assertLogs(multitenant.logger, "WARNING"):
+                asyncio.run(run())
+
+        self.assertEqual(multitenant._closing_tasks, set())
+
+    def test_batch_layers(self):
+        """Tests that batch calls are grouped by their dependencies."""
+        calls = [
+            {"id": "report", "tool": "run_report_mt", "input_from": {
+                "property_id": "accounts.0.property_summaries.0.property"}},
+            {"id": "accounts", "tool": "get_account_summaries_mt"},
+            {"id": "details", "tool": "get_property_details_mt",
+             "args": {"property_id": "123"}},
+        ]
+        layers = multitenant._batch_layers(calls)
+        self.assertEqual(
+            [sorted(call["id"] for call in layer) for layer in layers],
+            [["accounts", "details"], ["report"]],
+        )
+
+    def test_batch_layers_invalid_input(self):
+        """Tests that malformed batches raise a ValueError."""
+        with self.assertRaises(ValueError, msg="Unknown tool should fail"):
+            multitenant._batch_layers([{"id": "a", "tool": "unknown"}])
+        with self.assertRaises(ValueError, msg="Duplicate IDs should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "get_account_summaries_mt"},
+                {"id": "a", "tool": "get_account_summaries_mt"},
+            ])
+        with self.assertRaises(ValueError, msg="Unknown input should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "run_report_mt",
+                 "input_from": {"property_id": "b.0"}},
+            ])
+        with self.assertRaises(ValueError, msg="Non-list calls should fail"):
+            multitenant._batch_layers({"id": "a"})
+        with self.assertRaises(ValueError, msg="Non-dict call should fail"):
+            multitenant._batch_layers(["get_account_summaries_mt"])
+        with self.assertRaises(ValueError, msg="Non-dict args should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "run_report_mt", "args": ["123"]},
+            ])
+        with self.assertRaises(ValueError, msg="Non-dict input should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "run_report_mt", "input_from": ["b"]},
+            ])
+        with self.assertRaises(ValueError, msg="Non-str reference should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "run_report_mt",
+                 "input_from": {"property_id": 1}},
+            ])
+        with self.assertRaises(ValueError, msg="Cycles should fail"):
+            multitenant._batch_layers([
+                {"id": "a", "tool": "run_report_mt",
+                 "input_from": {"property_id": "b"}},
+                {"id": "b", "tool": "run_report_mt",
+                 "input_from": {"property_id": "a"}},
+            ])
+
+    def test_resolve_batch_reference(self):
+        """Tests resolving references into earlier call results."""
+        outcomes = {
+            "accounts": {"result": [
+                {"property_summaries": [{"property": "properties/1"}]}
+            ]}
+        }
+        self.assertEqual(
+            multitenant._resolve_batch_reference(
+                outcomes, "accounts.0.property_summaries.0.property"
+            ),
+            "properties/1",
+        )
+        self.assertEqual(
+            multitenant._resolve_batch_reference(outcomes, "accounts"),
+            outcomes["accounts"]["result"],
+        )
+
+    def test_batch_mt(self):
+        """Tests that batch_mt feeds results forward and reports failures."""
+
+        async def summaries(tenant_id, tenant_credentials):
+            return [{"property_summaries": [{"property": "properties/1"}]}]
+
+        async def details(tenant_id, tenant_credentials, property_id):
+            if property_id == "bad":
+                raise ValueError("Invalid property ID: bad")
+            return {"name": property_id}
+
+        tools = {
+            "get_account_summaries_mt": summaries,
+            "get_property_details_mt": details,
+        }
+        calls = [
+            {"id": "accounts", "tool": "get_account_summaries_mt"},
+            {"id": "details", "tool": "get_property_details_mt",
+             "input_from": {
+                 "property_id": "accounts.0.property_summaries.0.property"}},
+            {"id": "bad", "tool": "get_property_details_mt",
+             "args": {"property_id": "bad"}},
+            {"id": "after_bad", "tool": "get_property_details_mt",
+             "input_from": {"property_id": "bad.name"}},
+            {"id": "missing", "tool": "get_property_details_mt",
+             "input_from": {"property_id": "accounts.5.property"}},
+        ]
+        with mock.patch.dict(multitenant._BATCH_TOOLS, tools, clear=True):
+            outcomes = asyncio.run(
+                multitenant.batch_mt("tenant", "creds", calls)
+            )
+
+        self.assertEqual(
+            outcomes["details"], {"result": {"name": "properties/1"}}
+        )
+        self.assertEqual(outcomes["bad"]["error"]["code"], "INVALID_ARGUMENT")
+        self.assertEqual(
+            outcomes["after_bad"]["error"]["code"], "INVALID_ARGUMENT"
+        )
+        self.assertIn("bad", outcomes["after_bad"]["error"]["message"])
+        self.assertEqual(
+            outcomes["missing"]["error"]["code"], "INVALID_ARGUMENT"
+        )
+
+    def test_batch_mt_slow_down(self):
+        """Tests that a busy tenant surfaces as a SLOW_DOWN sub-call error."""
+
+        async def details(tenant_id, tenant_credentials, property_id):
+            await asyncio.sleep(0.05)
+            return {"name": property_id}
+
+        calls = [
+            {"id": "a", "tool": "get_property_details_mt",
+             "args": {"property_id": "1"}},
+            {"id": "b", "tool": "get_property_details_mt",
+             "args": {"property_id": "2"}},
+        ]
+        with mock.patch.dict(
+            multitenant._BATCH_TOOLS,
+            {"get_property_details_mt": details},
+            clear=True,
+        ), mock.patch.object(
+            multitenant, "_TENANT_MAX_CONCURRENCY", 1
+        ), mock.patch.object(
+            multitenant, "_TENANT_SLOT_TIMEOUT_SECONDS", 0.01
+        ), mock.patch.dict(multitenant._tenant_sem, clear=True):
+            outcomes = asyncio.run(
+                multitenant.batch_mt("tenant", "creds", calls)
+            )
+
+        self.assertEqual(
+            sorted(
+                outcome.get("error", {}).get("code", "OK")
+                for outcome in outcomes.values()
+            ),
+            ["OK", "SLOW_DOWN"],
+        )
+
+    def test_page_token_round_trip(self):
+        """Tests that a page token decodes to the offset it was issued for."""
+        token = multitenant._encode_page_token("properties/1", "abc", 100)
+        self.assertEqual(
+            multitenant._decode_page_token(token, "properties/1", "abc"), 100
+        )
+
+    def test_page_token_invalid_input(self):
+        """Tests that malformed or mismatched page tokens raise a ValueError."""
+        token = multitenant._encode_page_token("properties/1", "abc", 100)
+        with self.assertRaises(ValueError, msg="Non-base64 token should fail"):
+            multitenant._decode_page_token(
+                "not a token!", "properties/1", "abc"
+            )
+        with self.assertRaises(ValueError, msg="Non-JSON token should fail"):
+            multitenant._decode_page_token(
+                base64.urlsafe_b64encode(b"not json").decode(),
+                "properties/1",
+                "abc",
+            )
+        with self.assertRaises(ValueError, msg="Negative offset should fail"):
+            multitenant._decode_page_token(
+                multitenant._encode_page_token("properties/1", "abc", -1),
+                "properties/1",
+                "abc",
+            )
+        with self.assertRaises(ValueError, msg="Other property should fail"):
+            multitenant._decode_page_token(token, "properties/2", "abc")
+        with self.assertRaises(ValueError, msg="Other query should fail"):
+            multitenant._decode_page_token(token, "properties/1", "def")
+
+    def test_run_report_mt_pagination(self):
+        """Tests that next_page_token is issued until the last page."""
+        client = _FakeDataClient(row_count=5)
+        query = {
+            "property_id": "1",
+            "date_ranges": [{"start_date": "7daysAgo", "end_date": "today"}],
+            "dimensions": ["country"],
+            "page_size": 2,
+        }
+
+        async def run():
+            pages = [
+                await multitenant.run_report_mt("tenant", "creds", **query)
+            ]
+            while "next_page_token" in pages[-1]:
+                pages.append(
+                    await multitenant.run_report_mt(
+                        "tenant", "creds", **query,
+                        page_token=pages[-1]["next_page_token"],
+                    )
+                )
+            return pages
+
+        with _patch_data_client(client):
+            pages = asyncio.run(run())
+
+        self.assertEqual([len(page["rows"]) for page in pages], [2, 2, 1])
+        self.assertEqual(
+            [request.offset for request in client.requests], [0, 2, 4]
+        )
+
+    def test_run_report_mt_limit_and_offset(self):
+        """Tests that limit overrides page_size and offset skips rows."""
+        client = _FakeDataClient(row_count=5)
+        query = {
+            "property_id": "1",
+            "date_ranges": [{"start_date": "7daysAgo", "end_date": "today"}],
+            "page_size": 2,
+        }
+        with _patch_data_client(client):
+            result = asyncio.run(
+                multitenant.run_report_mt(
+                    "tenant", "creds", **query, limit=3, offset=2
+                )
+            )
+            token = multitenant._encode_page_token(
+                "properties/1",
+                multitenant._report_query_hash(
+                    query["date_ranges"], None, None, None, None, None
+                ),
+                2,
+            )
+            with self.assertRaises(
+                ValueError, msg="offset and page_token should conflict"
+            ):
+                asyncio.run(
+                    multitenant.run_report_mt(
+                        "tenant", "creds", **query, offset=2, page_token=token
+                    )
+                )
+
+        self.assertEqual(client.requests[0].limit, 3)
+        self.assertEqual(len(result["rows"]), 3)
+        self.assertNotIn("next_page_token", result)
+
+    def test_stream_report_mt(self):
+        """Tests that streamed reports split the rows from the header."""
+        client = _FakeDataClient(row_count=3)
+        with _patch_data_client(client):
+            header, rows = asyncio.run(
+                multitenant.stream_report_mt(
+                    "tenant",
+                    "creds",
+                    property_id="1",
+                    date_ranges=[
+                        {"start_date": "7daysAgo", "end_date": "today"}
+                    ],
+                    page_size=2,
+                )
+            )
+
+        self.assertNotIn("rows", header)
+        self.assertEqual(header["row_count"], 3)
+        self.assertIn("next_page_token", header)
+        self.assertEqual(
+            [row["dimension_values"][0]["value"] for row in rows], ["0", "1"]
+        )
+
+    def test_report_header(self):
+        """Tests that the report header has every field except rows."""
+        response = data_v1beta.RunReportResponse(
+            dimension_headers=[data_v1beta.DimensionHeader(name="country")],
+            rows=[data_v1beta.Row()],
+            totals=[data_v1beta.Row()],
+            row_count=1,
+            metadata=data_v1beta.ResponseMetaData(currency_code="USD"),
+        )
+        expected = multitenant.proto_to_dict(response)
+        del expected["rows"]
+        self.assertEqual(multitenant._report_header(response), expected)
+
+    def test_tenant_limited_slow_down(self):
+        """Tests that a busy tenant gets a SLOW_DOWN error."""
+        release = asyncio.Event()
+
+        @multitenant._tenant_limited
+        async def tool(tenant_id):
+            await release.wait()
+            return {"ok": True}
+
+        async def run():
+            first = asyncio.create_task(tool("tenant-busy"))
+            await asyncio.sleep(0)
+            second = await tool("tenant-busy")
+            other = asyncio.create_task(tool("tenant-other"))
+            release.set()
+            return await first, second, await other
+
+        with mock.patch.object(
+            multitenant, "_TENANT_MAX_CONCURRENCY", 1
+        ), mock.patch.object(
+            multitenant, "_TENANT_SLOT_TIMEOUT_SECONDS", 0.01
+        ), mock.patch.dict(multitenant._tenant_sem, clear=True):
+            first, second, other = asyncio.run(run())
+            tenant_sem = dict(multitenant._tenant_sem)
+
+        self.assertEqual(first, {"ok": True})
+        self.assertEqual(second["error"]["code"], "SLOW_DOWN")
+        self.assertEqual(other, {"ok": True})
+        self.assertEqual(tenant_sem, {}, "Idle tenants should be pruned")
+
+    def test_single_flight(self):
+        """Tests that concurrent identical calls share one execution."""
+        calls = []
+
+        @multitenant._single_flight
+        async def tool(tenant_id, tenant_credentials, property_id=None):
+            calls.append(property_id)
+            await asyncio.sleep(0.01)
+            return {"property": property_id}
+
+        async def run():
+            return await asyncio.gather(
+                tool("tenant", "creds", property_id="1"),
+                tool("tenant", "creds", "1"),
+                tool("tenant", "creds", property_id="2"),
+            )
+
+        first, second, third = asyncio.run(run())
+        self.assertEqual(calls, ["1", "2"])
+        self.assertIs(first, second)
+        self.assertEqual(third, {"property": "2"})
+        self.assertEqual(multitenant._inflight, {})
+
+    def test_single_flight_leader_cancelled(self):
+        """Tests that waiting callers rerun a call whose issuer is cancelled."""
+        calls = []
+
+        @multitenant._single_flight
+        async def tool(tenant_id, tenant_credentials):
+            calls.append(tenant_id)
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        async def run():
+            leader = asyncio.create_task(tool("tenant", "creds"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(tool("tenant", "creds"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        self.assertEqual(asyncio.run(run()), {"ok": True})
+        self.assertEqual(calls, ["tenant", "tenant"])
+        self.assertEqual(multitenant._inflight, {})
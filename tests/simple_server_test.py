@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the HTTP server wrapper."""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+try:
+    from fastapi.testclient import TestClient
+
+    import simple_server
+except ImportError:  # The server dependencies are only in the Docker image.
+    simple_server = None
+
+
+@unittest.skipIf(simple_server is None, "fastapi is not installed")
+class TestSimpleServer(unittest.TestCase):
+    """Test cases for the HTTP server wrapper."""
+
+    def setUp(self):
+        # Not used as a context manager, so the startup hooks don't run.
+        self.client = TestClient(simple_server.app)
+        self.payload = {
+            "jsonrpc": "2.0",
+            "method": "run_report_mt",
+            "params": {
+                "tenant_id": "tenant",
+                "tenant_credentials": "creds",
+                "property_id": "1",
+                "date_ranges": [
+                    {"start_date": "7daysAgo", "end_date": "today"}
+                ],
+            },
+            "id": 7,
+        }
+
+    def test_ndjson_report(self):
+        """Tests that NDJSON clients get the envelope, then one row per line."""
+
+        async def stream(**kwargs):
+            return {"row_count": 2}, iter([{"i": 0}, {"i": 1}])
+
+        with mock.patch.dict(
+            simple_server._STREAMING_TOOLS, {"run_report_mt": stream}
+        ):
+            response = self.client.post(
+                "/",
+                json=self.payload,
+                headers={"Accept": "application/x-ndjson"},
+            )
+
+        self.assertEqual(
+            response.headers["content-type"], "application/x-ndjson"
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(
+            lines,
+            [
+                {"jsonrpc": "2.0", "result": {"row_count": 2}, "id": 7},
+                {"i": 0},
+                {"i": 1},
+            ],
+        )
+
+    def test_invalid_params(self):
+        """Tests that params not matching the tool signature are rejected."""
+        self.payload["params"]["unknown"] = 1
+        response = self.client.post(
+            "/",
+            json=self.payload,
+            headers={"Accept": "application/x-ndjson"},
+        )
+        self.assertEqual(response.json()["error"]["code"], -32602)
+
+    def test_warmup_connects_admin_channel(self):
+        """Tests that warmup waits for the shared client's channel."""
+        channel = mock.Mock(channel_ready=mock.AsyncMock())
+        client = mock.Mock()
+        client.transport.grpc_channel = channel
+        with mock.patch.object(
+            simple_server, "get_shared_admin_api_client", return_value=client
+        ), mock.patch.object(simple_server, "_create_credentials"):
+            asyncio.run(simple_server.warmup())
+
+        channel.channel_ready.assert_awaited_once()
+
+    def test_executor_workers(self):
+        """Tests that the thread pool size is capped and can be overridden."""
+        with mock.patch.dict("os.environ", {"EXECUTOR_MAX_WORKERS": "3"}):
+            self.assertEqual(simple_server._executor_workers(), 3)
+        with mock.patch.dict("os.environ", clear=True), mock.patch.object(
+            simple_server.os, "sched_getaffinity", return_value=set(range(64)),
+            create=True,
+        ):
+            self.assertEqual(
+                simple_server._executor_workers(),
+                simple_server._EXECUTOR_MAX_WORKERS_CAP,
+            )
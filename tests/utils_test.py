@@ -14,6 +14,8 @@
 
 """Test cases for the utils module."""
 
+import asyncio
+import types
 import unittest
 
 from analytics_mcp.tools import utils
@@ -44,6 +46,11 @@ class TestUtils(unittest.TestCase):
             "properties/12345",
             "Full resource name should be considered valid",
         )
+        self.assertEqual(
+            utils.construct_property_rn("properties/007"),
+            "properties/7",
+            "Leading zeros should be dropped",
+        )
 
     def test_construct_property_rn_invalid_input(self):
         """Tests that construct_property_rn raises a ValueError for invalid input."""
@@ -68,3 +75,50 @@ class TestUtils(unittest.TestCase):
             msg="Resource name with more than 2 components should fail",
         ):
             utils.construct_property_rn("properties/123/abc")
+        with self.assertRaises(
+            ValueError, msg="Resource name with a nested ID should fail"
+        ):
+            utils.construct_property_rn("properties/abc/123")
+        with self.assertRaises(ValueError, msg="Negative ID should fail"):
+            utils.construct_property_rn(-123)
+        with self.assertRaises(ValueError, msg="Unhashable input should fail"):
+            utils.construct_property_rn(["123"])
+
+    def test_drain_pager_prefetch(self):
+        """Tests that _drain_pager_prefetch yields the items of every page."""
+
+        class FakePager:
+            @property
+            async def pages(self):
+                for items in ([1, 2], [], [3]):
+                    yield types.SimpleNamespace(things=items)
+
+        async def drain():
+            return [
+                item
+                async for item in utils._drain_pager_prefetch(
+                    FakePager(), "things", depth=1
+                )
+            ]
+
+        self.assertEqual(asyncio.run(drain()), [1, 2, 3])
+
+    def test_drain_pager_prefetch_error(self):
+        """Tests that _drain_pager_prefetch re-raises page fetch errors."""
+
+        class FailingPager:
+            @property
+            async def pages(self):
+                yield types.SimpleNamespace(things=[1])
+                raise RuntimeError("fetch failed")
+
+        async def drain():
+            return [
+                item
+                async for item in utils._drain_pager_prefetch(
+                    FailingPager(), "things"
+                )
+            ]
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(drain())